@@ -32,7 +32,6 @@ Example:
 __version__ = "0.1.1"
 
 from .client import MaseDBClient
-from .async_client import AsyncMaseDBClient
 from .exceptions import (
     MaseDBError,
     BadRequestError,
@@ -59,4 +58,11 @@ __all__ = [
     'RateLimitError',
     'InternalError',
     'ServiceUnavailableError'
-] 
\ No newline at end of file
+]
+
+def __getattr__(name):
+    # aiohttp is only imported once the async client is first used
+    if name == 'AsyncMaseDBClient':
+        from .async_client import AsyncMaseDBClient
+        return AsyncMaseDBClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
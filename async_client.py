@@ -87,19 +87,112 @@ Example:
     >>> asyncio.run(main())
 """
 
+import asyncio
+import atexit
 import aiohttp
-import logging
+import email.utils
+import gzip
 import json
-from typing import Dict, List, Optional, Union, Any, TypedDict
+import logging
+import os
+import random
+import time
+import yarl
+from collections import deque
+from typing import Deque, Dict, List, Optional, Union, Any, Tuple, TypedDict, Awaitable, Callable, Iterable, AsyncIterator
 from datetime import datetime
 from .exceptions import MaseDBError, ERROR_MAP
 
-# Настройка логирования
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Настройка логирования: уровень и обработчики задает приложение
 logger = logging.getLogger('AsyncMaseDBClient')
+logger.addHandler(logging.NullHandler())
+
+# Opt-in: run asyncio on uvloop for lower per-request event loop overhead
+if os.environ.get('MASEDB_USE_UVLOOP') == '1':
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        logger.warning("MASEDB_USE_UVLOOP is set but uvloop is not installed, using the default event loop")
+
+# orjson is optional; fall back to the standard library when it is not installed
+try:
+    import orjson
+    _loads = orjson.loads
+    
+    # numpy arrays are serialized natively, naive datetimes are treated as UTC and
+    # non-str dict keys are converted to strings as the standard library does
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+    
+    # Integers wider than 64 bits are rejected by orjson but supported by the standard library
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            return json.dumps(obj, separators=(',', ':')).encode()
+    
+    def _dumps_sorted(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS).decode()
+        except TypeError:
+            return json.dumps(obj, separators=(',', ':'), sort_keys=True)
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+    
+    def _dumps_sorted(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'), sort_keys=True)
+
+# Statuses meaning the server has no bulk endpoint for a collection
+_BULK_UNSUPPORTED_STATUSES = frozenset({404, 405})
+
+# Methods whose requests always carry a JSON body
+_WRITE_METHODS = frozenset({'POST', 'PUT'})
+
+# Per-request headers for JSON bodies, shared by all calls and never mutated
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+_GZIP_JSON_HEADERS = {'Content-Type': 'application/json', 'Content-Encoding': 'gzip'}
+
+# Pre-encoded body for POST endpoints that take no parameters
+_EMPTY_JSON_BYTES = b'{}'
+
+# Request bodies smaller than this are not worth compressing
+_COMPRESS_MIN_SIZE = 1024
+
+# Transient failures are retried for methods that are safe to repeat,
+# failures to connect for any method
+_MAX_RETRIES = 3
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({'GET', 'PUT', 'DELETE'})
+
+# The circuit breaker opens when more than half of the last calls failed
+_BREAKER_WINDOW = 50
+_BREAKER_COOLDOWN = 5.0
+
+# Maximum number of entries in the metadata cache before LFU eviction
+_META_CACHE_SIZE = 1024
+
+# Size of network reads fed to the streaming JSON parser
+_STREAM_CHUNK_SIZE = 65536
+
+class _LeaderCancelled(Exception):
+    """Set on a shared in-flight GET whose sending caller was cancelled, so followers retry it"""
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header (delay in seconds or HTTP date) to seconds to wait"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
 
 class CollectionInfo(TypedDict):
     """Type definition for collection information"""
@@ -156,110 +249,354 @@ class AsyncMaseDBClient:
     API Key Authentication:
     Include the API key in the X-API-Key header:
     X-API-Key: <your_api_key>
+
+    Connection Pooling:
+    Requests are sent over HTTP/1.1 keep-alive connections. Up to ``pool_size``
+    requests run in parallel, each on its own pooled connection, and
+    connections are reused across requests and across client instances that
+    share a base URL and API key and run on the same event loop.
     """
-    
-    def __init__(self, api_key: str, base_url: str = "https://masedb.maseai.online"):
+
+    # Sessions reused by clients that are not used as context managers,
+    # keyed by (base_url, api_key, event loop) since a session is bound to its loop
+    _shared_sessions: Dict[Tuple[str, str, asyncio.AbstractEventLoop], aiohttp.ClientSession] = {}
+
+    def __init__(self, api_key: str, base_url: str = "https://masedb.maseai.online", pool_size: int = 100,
+                 cache_ttl: float = 5.0, compress_requests: bool = False, max_concurrency: int = 50):
         """
         Initialize the client with API key
         
         Args:
             api_key (str): Your Mase Database API key
             base_url (str): Base URL of the API server
+            pool_size (int): Maximum number of pooled keep-alive connections
+            cache_ttl (float): Seconds to cache collection, index and stats metadata
+            compress_requests (bool): Gzip large request bodies (the server must accept
+                ``Content-Encoding: gzip``)
+            max_concurrency (int): Maximum number of requests this client has in flight at once
         """
         self.api_key = api_key
         self.BASE_URL = base_url.rstrip('/')
+        self._base = yarl.URL(self.BASE_URL)
+        # URLs of endpoints without path parameters are built once
+        self._collections_url = self._url('api', 'collections')
+        self._collections_list_url = self._url('api', 'collections', 'list')
+        self._transaction_url = self._url('api', 'transaction')
+        self._stats_url = self._url('api', 'stats')
+        self._detailed_stats_url = self._url('api', 'stats', 'detailed')
         self.headers = {
             'X-API-Key': api_key,
             'Accept': 'application/json'
         }
+        self._compress_requests = compress_requests
+        self._pool_size = pool_size
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._connector: Optional[aiohttp.TCPConnector] = None
         self._session: Optional[aiohttp.ClientSession] = None
-        logger.info(f"Initialized AsyncMaseDB client with base URL: {self.BASE_URL}")
+        self._meta_ttl = cache_ttl
+        self._meta_cache: Dict[str, Tuple[float, Any]] = {}
+        self._meta_hits: Dict[str, int] = {}
+        self._meta_generation = 0
+        self._breaker_window: Deque[bool] = deque(maxlen=_BREAKER_WINDOW)
+        self._breaker_failures = 0
+        self._breaker_open_until = 0.0
+        self._inflight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        logger.debug("Initialized AsyncMaseDB client with base URL: %s", self.BASE_URL)
     
     async def __aenter__(self):
         """Create aiohttp session when entering context"""
-        self._session = aiohttp.ClientSession(headers=self.headers)
+        self._session = self._create_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Close aiohttp session when exiting context"""
+        """Close aiohttp session and connection pool when exiting context"""
+        await self.close()
+    
+    async def close(self) -> None:
+        """
+        Close the session and connection pool opened by ``async with``.
+        
+        Shared sessions used outside ``async with`` are closed with close_all().
+        """
         if self._session:
             await self._session.close()
             self._session = None
+        if self._connector:
+            await self._connector.close()
+            self._connector = None
+    
+    aclose = close
     
     @property
     def session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
-        if self._session is None:
-            self._session = aiohttp.ClientSession(headers=self.headers)
-        return self._session
+        """
+        Get aiohttp session.
+
+        Returns the session opened by ``async with`` if there is one, otherwise
+        the session shared by all clients with the same base URL and API key
+        on the running event loop.
+        """
+        if self._session is not None:
+            return self._session
+        # Lookup and creation do not await, so this cannot race within the event loop
+        key = (self.BASE_URL, self.api_key, asyncio.get_running_loop())
+        session = self._shared_sessions.get(key)
+        if session is None or session.closed:
+            # Sessions of event loops that have been closed can no longer be used
+            for stale in [k for k in self._shared_sessions if k[2].is_closed()]:
+                del self._shared_sessions[stale]
+            logger.warning(f"Opening shared session for {self.BASE_URL}; use 'async with AsyncMaseDBClient(...)' "
+                           f"or call AsyncMaseDBClient.close_all() to release its connections")
+            session = aiohttp.ClientSession(connector=self._create_connector(), headers=self.headers)
+            self._shared_sessions[key] = session
+        return session
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close the shared sessions of the running event loop created by clients used outside ``async with``"""
+        loop = asyncio.get_running_loop()
+        sessions = []
+        for key in list(cls._shared_sessions):
+            # Sessions of closed loops cannot be closed anymore and are only dropped
+            if key[2] is loop:
+                sessions.append(cls._shared_sessions.pop(key))
+            elif key[2].is_closed():
+                del cls._shared_sessions[key]
+        for session in sessions:
+            await session.close()
+
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """Create connection pool tuned for keep-alive reuse"""
+        return aiohttp.TCPConnector(
+            limit=self._pool_size,
+            limit_per_host=self._pool_size,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create aiohttp session on top of the client's own connection pool"""
+        if self._connector is None or self._connector.closed:
+            self._connector = self._create_connector()
+        return aiohttp.ClientSession(
+            connector=self._connector,
+            connector_owner=False,
+            headers=self.headers
+        )
     
     async def _handle_response(self, response: aiohttp.ClientResponse) -> Any:
         """Handle API response and raise appropriate exceptions"""
+        status = response.status
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
         # Log response details
-        logger.debug(f"Response status code: {response.status}")
-        logger.debug(f"Response headers: {response.headers}")
+        if debug:
+            logger.debug("Response status code: %s", status)
+            logger.debug("Response headers: %s", response.headers)
         
-        # Get response body
+        # Read response body once; it is only decoded to text for logging and errors
         try:
-            body = await response.text()
-            logger.debug(f"Response body: {body}")
+            raw = await response.read()
         except Exception as e:
             logger.error(f"Error reading response body: {str(e)}")
-            body = None
+            raw = b''
+        if debug:
+            logger.debug("Response body: %s", raw.decode('utf-8', 'replace'))
             
-        # Check content type
-        content_type = response.headers.get('Content-Type', '')
-        if response.ok:
-            if not body:
+        if status < 400:
+            if not raw:
                 return None
-            if 'application/json' not in content_type:
-                logger.error(f"Expected JSON response, got {content_type}")
-                raise MaseDBError(f"Invalid response format: Expected JSON, got {content_type}")
+            # Content type is only checked to explain a body that fails to parse
             try:
-                return await response.json()
+                return _loads(raw)
             except ValueError as e:
+                content_type = response.headers.get('Content-Type', '')
+                if 'application/json' not in content_type:
+                    logger.error(f"Expected JSON response, got {content_type}")
+                    raise MaseDBError(f"Invalid response format: Expected JSON, got {content_type}")
                 logger.error(f"Error decoding JSON response: {str(e)}")
                 raise MaseDBError(f"Invalid JSON response: {str(e)}")
         else:
             # Try to get error details from response
-            error_message = f"HTTP {response.status}: {body or 'No response body'}"
+            content_type = response.headers.get('Content-Type', '')
+            retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+            body = raw.decode('utf-8', 'replace')
+            error_message = f"HTTP {status}: {body or 'No response body'}"
             if 'application/json' in content_type:
                 try:
-                    error_data = await response.json()
+                    error_data = _loads(raw)
                     if 'error' in error_data:
                         error_message = error_data['error'].get('message', error_message)
                         error_code = error_data['error'].get('code', 'UNKNOWN_ERROR')
                         error_details = error_data['error'].get('details', {})
-                        raise MaseDBError(error_message, error_code, error_details)
+                        raise MaseDBError(error_message, error_code, error_details, status, retry_after)
                 except ValueError:
                     pass
             logger.error(f"API error: {error_message}")
-            raise MaseDBError(error_message)
+            raise MaseDBError(error_message, status_code=status, retry_after=retry_after)
     
-    async def _request(self, method: str, endpoint: str, **kwargs) -> Any:
-        """Make HTTP request to API"""
-        url = f"{self.BASE_URL}{endpoint}"
+    def _url(self, *parts: str) -> yarl.URL:
+        """Build API URL from path segments, reusing the pre-parsed base URL"""
+        return self._base.joinpath(*parts)
+    
+    async def _request(self, method: str, url: yarl.URL, **kwargs) -> Any:
+        """Make HTTP request to API, sharing one in-flight request between identical GETs"""
+        if method != 'GET':
+            return await self._send(method, url, **kwargs)
         
-        # Add API key to headers
-        headers = kwargs.pop('headers', {})
-        headers['X-API-Key'] = self.api_key
-        headers['Accept'] = 'application/json'
+        key = (method, str(url), _dumps_sorted(kwargs.get('params') or {}))
+        inflight = self._inflight.get(key)
+        while inflight is not None:
+            try:
+                # Shield so a cancelled follower does not cancel the request for everyone
+                return await asyncio.shield(inflight)
+            except _LeaderCancelled:
+                # The caller sending the request was cancelled; send it again or join whoever does
+                inflight = self._inflight.get(key)
         
-        # Only set Content-Type for POST/PUT requests
-        if method in ['POST', 'PUT']:
-            headers['Content-Type'] = 'application/json'
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._send(method, url, **kwargs)
+        except asyncio.CancelledError:
+            # Cancelling the shared future would cancel every follower as well
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case no other caller was waiting
+            future.exception()
+            raise
         else:
-            # Remove Content-Type for GET/DELETE requests
-            headers.pop('Content-Type', None)
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+    
+    async def _send(self, method: str, url: yarl.URL, **kwargs) -> Any:
+        """Send HTTP request to API, retrying transient failures with exponential backoff"""
+        # X-API-Key and Accept are session defaults, only Content-Type varies per request
+        headers = _JSON_HEADERS if method in _WRITE_METHODS or 'json' in kwargs else None
         
         # Log request details
-        logger.debug(f"Making {method} request to {url}")
-        logger.debug(f"Request headers: {headers}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Making %s request to %s", method, url)
+            logger.debug("Request headers: %s", headers)
+            if 'json' in kwargs:
+                logger.debug("Request body: %s", kwargs['json'])
         if 'json' in kwargs:
-            logger.debug(f"Request body: {kwargs['json']}")
+            # Serialize with orjson (when available) instead of letting aiohttp use stdlib json
+            body = _dumps(kwargs.pop('json'))
+            if self._compress_requests and len(body) > _COMPRESS_MIN_SIZE:
+                body = gzip.compress(body, 1)
+                headers = _GZIP_JSON_HEADERS
+            kwargs['data'] = body
             
-        async with self.session.request(method, url, headers=headers, **kwargs) as response:
-            return await self._handle_response(response)
+        # The breaker is checked and updated once per call, never between retries of a call
+        if time.monotonic() < self._breaker_open_until:
+            raise MaseDBError("Circuit breaker is open after repeated failures, retry later", 'CIRCUIT_OPEN')
+        idempotent = method in _IDEMPOTENT_METHODS
+        for attempt in range(_MAX_RETRIES + 1):
+            try:
+                async with self._semaphore, self.session.request(method, url, headers=headers, **kwargs) as response:
+                    result = await self._handle_response(response)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError, MaseDBError) as e:
+                transient = not isinstance(e, MaseDBError) or e.status_code in _RETRY_STATUSES
+                # A request that failed to connect never reached the server, so any method may repeat it
+                retryable = transient and (idempotent or isinstance(e, aiohttp.ClientConnectorError))
+                if not retryable or attempt == _MAX_RETRIES:
+                    self._record_call(failed=transient)
+                    raise
+                delay = 2 ** attempt * 0.1 + random.random() * 0.05
+                logger.warning(f"{method} {url} failed ({e}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+            else:
+                self._record_call(failed=False)
+                return result
+
+    def _record_call(self, failed: bool) -> None:
+        """Record the outcome of a call and open the circuit breaker if most recent calls failed"""
+        window = self._breaker_window
+        if len(window) == window.maxlen:
+            self._breaker_failures -= window[0]
+        window.append(failed)
+        self._breaker_failures += failed
+        if len(window) == window.maxlen and self._breaker_failures * 2 > len(window):
+            logger.error(f"Circuit breaker opened for {_BREAKER_COOLDOWN}s: "
+                         f"{self._breaker_failures} of the last {len(window)} calls failed")
+            self._breaker_open_until = time.monotonic() + _BREAKER_COOLDOWN
+            window.clear()
+            self._breaker_failures = 0
+
+    async def _cached(self, key: str, ttl: float, coro_factory: Callable[[], Awaitable]) -> Any:
+        """Return the cached result for ``key`` if younger than ``ttl`` seconds, otherwise fetch and cache it"""
+        entry = self._meta_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            self._meta_hits[key] += 1
+            return entry[1]
+        generation = self._meta_generation
+        value = await coro_factory()
+        # Do not store a result that may predate an invalidation made while it was in flight
+        if generation != self._meta_generation:
+            return value
+        if key not in self._meta_cache and len(self._meta_cache) >= _META_CACHE_SIZE:
+            # Evict the least frequently used entry
+            victim = min(self._meta_hits, key=self._meta_hits.get)
+            del self._meta_cache[victim]
+            del self._meta_hits[victim]
+        self._meta_cache[key] = (time.monotonic(), value)
+        self._meta_hits.setdefault(key, 0)
+        return value
+
+    def _invalidate(self, *keys: str) -> None:
+        """Drop cached metadata entries affected by a write"""
+        self._meta_generation += 1
+        for key in keys:
+            self._meta_cache.pop(key, None)
+            self._meta_hits.pop(key, None)
+
+    def clear_cache(self) -> None:
+        """Drop all cached collection, index and stats metadata"""
+        self._meta_generation += 1
+        self._meta_cache.clear()
+        self._meta_hits.clear()
+
+    async def _gather_limited(self, aws: Iterable[Awaitable], limit: Optional[int] = None,
+                              return_exceptions: bool = False) -> List[Any]:
+        """Await all awaitables concurrently, running at most ``limit`` (default: pool size) at once"""
+        semaphore = asyncio.Semaphore(limit or self._pool_size)
+
+        async def run(aw: Awaitable) -> Any:
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
+
+    async def _bulk_request(self, method: str, collection_name: str, field: str, items: List[Any],
+                            chunk_size: int, fallback: Callable[[Any], Awaitable]) -> List[Dict]:
+        """Send items to the collection's bulk endpoint in chunks, or one by one if it is unavailable"""
+        if not items:
+            return []
+        url = self._url('api', collection_name, 'bulk')
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        # Send the first chunk alone so a missing bulk endpoint is detected before fanning out
+        try:
+            first = await self._request(method, url, json={field: chunks[0]})
+        except MaseDBError as e:
+            if e.status_code not in _BULK_UNSUPPORTED_STATUSES:
+                raise
+            logger.debug("Bulk endpoint unavailable (HTTP %s), sending items one by one", e.status_code)
+            return await self._gather_limited(fallback(item) for item in items)
+        try:
+            rest = await self._gather_limited(
+                self._request(method, url, json={field: chunk}) for chunk in chunks[1:]
+            )
+        finally:
+            # The first chunk is written even if a later one fails
+            self._invalidate('collections', f'collection:{collection_name}', 'stats')
+        return [first] + rest
 
     async def find_one(self, collection_name: str, query: Optional[Dict] = None) -> Optional[DocumentInfo]:
         """
@@ -293,13 +630,20 @@ class AsyncMaseDBClient:
                 "age": 30
             }
         """
-        results = await self.list_documents(collection_name, query)
+        # Only the first match is needed, so let the server stop after one document
+        results = await self.list_documents(collection_name, query, limit=1)
+        # Documents come either as a bare list or as {"documents": [...]}
+        if isinstance(results, dict):
+            results = results.get('documents')
         return results[0] if results else None
 
     async def insert_one(self, collection_name: str, document: Dict) -> Dict:
         """
         Insert a single document into the collection.
         
+        To insert several documents, use insert_many, which sends them in
+        batches instead of one request per document.
+        
         Args:
             collection_name (str): Name of the collection
             document (Dict): Document to insert
@@ -315,6 +659,35 @@ class AsyncMaseDBClient:
             {"id": "doc123"}
         """
         return await self.create_document(collection_name, document)
+
+    async def insert_many(self, collection_name: str, documents: List[Dict], chunk_size: int = 500) -> List[Dict]:
+        """
+        Insert multiple documents into the collection.
+        
+        Documents are sent to the bulk endpoint in chunks of ``chunk_size``, with
+        chunks uploaded concurrently. If the server has no bulk endpoint, each
+        document is created with its own request, still concurrently.
+        
+        Args:
+            collection_name (str): Name of the collection
+            documents (List[Dict]): Documents to insert
+            chunk_size (int, optional): Maximum number of documents per request
+            
+        Returns:
+            List[Dict]: Server responses, one per chunk (or one per document
+                if the bulk endpoint is unavailable)
+            
+        Example:
+            >>> await client.insert_many("users", [
+            ...     {"name": "John", "age": 30},
+            ...     {"name": "Jane", "age": 25}
+            ... ])
+            [{"message": "Documents created successfully", "count": 2}]
+        """
+        return await self._bulk_request(
+            'POST', collection_name, 'documents', documents, chunk_size,
+            lambda document: self.create_document(collection_name, document)
+        )
     
     # Collections API
     async def list_collections(self) -> List[CollectionInfo]:
@@ -337,7 +710,8 @@ class AsyncMaseDBClient:
                 }
             ]
         """
-        return await self._request('GET', '/api/collections')
+        return await self._cached('collections', self._meta_ttl,
+                                  lambda: self._request('GET', self._collections_url))
 
     async def list_collections_detailed(self) -> Dict:
         """
@@ -364,7 +738,7 @@ class AsyncMaseDBClient:
                 "total": 1
             }
         """
-        return await self._request('GET', '/api/collections/list')
+        return await self._request('GET', self._collections_list_url)
 
     async def create_collection(self, name: str, description: str = "") -> Dict:
         """
@@ -389,10 +763,12 @@ class AsyncMaseDBClient:
                 }
             }
         """
-        return await self._request('POST', '/api/collections', json={
+        result = await self._request('POST', self._collections_url, json={
             "name": name,
             "description": description
         })
+        self._invalidate('collections', 'stats')
+        return result
     
     async def get_collection(self, name: str) -> Dict:
         """
@@ -416,7 +792,8 @@ class AsyncMaseDBClient:
                 "indexes": []
             }
         """
-        return await self._request('GET', f'/api/collections/{name}')
+        return await self._cached(f'collection:{name}', self._meta_ttl,
+                                  lambda: self._request('GET', self._url('api', 'collections', name)))
     
     async def delete_collection(self, name: str) -> Dict:
         """
@@ -435,7 +812,9 @@ class AsyncMaseDBClient:
             >>> await client.delete_collection("users")
             {"message": "Collection deleted successfully"}
         """
-        return await self._request('DELETE', f'/api/collections/{name}')
+        result = await self._request('DELETE', self._url('api', 'collections', name))
+        self._invalidate('collections', f'collection:{name}', f'indexes:{name}', 'stats')
+        return result
     
     # Documents API
     async def list_documents(self, collection_name: str, query: Optional[Dict] = None, sort: Optional[Dict] = None, limit: Optional[int] = None) -> List[DocumentInfo]:
@@ -483,15 +862,85 @@ class AsyncMaseDBClient:
                 "count": 1
             }
         """
+        return await self._request('GET', self._url('api', collection_name), params=self._list_params(query, sort, limit))
+
+    async def iter_documents(self, collection_name: str, query: Optional[Dict] = None, sort: Optional[Dict] = None, limit: Optional[int] = None) -> AsyncIterator[DocumentInfo]:
+        """
+        Iterate over documents from collection while the response streams in.
+        
+        Unlike list_documents, the response is parsed incrementally and each
+        document is yielded as soon as it has been received, so memory use is
+        bounded by a single document instead of the whole result set. For small
+        results list_documents is faster. Requires the ``ijson`` package.
+        
+        Only sending the request counts towards ``max_concurrency``; an open
+        iterator does not, so other client calls may be awaited inside the loop.
+        
+        Args:
+            collection_name (str): Name of the collection
+            query (Dict, optional): Query conditions for filtering documents (see list_documents)
+            sort (Dict, optional): Fields for sorting (1 for ascending, -1 for descending)
+            limit (int, optional): Maximum number of documents to return
+            
+        Yields:
+            DocumentInfo: Documents matching the query
+            
+        Example:
+            >>> async for document in client.iter_documents("users", {"age": {"$gt": 25}}):
+            ...     print(document["name"])
+        """
+        try:
+            import ijson
+        except ImportError:
+            raise ImportError("iter_documents requires the 'ijson' package: pip install ijson")
+        
+        url = self._url('api', collection_name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Streaming GET request to %s", url)
+        # The concurrency slot is released before yielding so the caller's loop body cannot deadlock on it
+        async with self._semaphore:
+            response = await self.session.get(url, params=self._list_params(query, sort, limit))
+        async with response:
+            if not response.ok:
+                # Raises the matching MaseDBError
+                await self._handle_response(response)
+            events = ijson.sendable_list()
+            parser = None
+            try:
+                async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+                    if parser is None:
+                        head = chunk.lstrip()
+                        if not head:
+                            continue
+                        # Documents come either as a bare list or as {"documents": [...]}
+                        prefix = 'item' if head[:1] == b'[' else 'documents.item'
+                        parser = ijson.items_coro(events, prefix, use_float=True)
+                    parser.send(chunk)
+                    for document in events:
+                        yield document
+                    del events[:]
+                if parser is not None:
+                    parser.close()
+                    for document in events:
+                        yield document
+            except ijson.JSONError as e:
+                logger.error(f"Error decoding JSON response: {str(e)}")
+                raise MaseDBError(f"Invalid JSON response: {str(e)}")
+
+    @staticmethod
+    def _list_params(query: Optional[Dict], sort: Optional[Dict], limit: Optional[int]) -> Dict:
+        """Build query-string parameters for listing documents"""
         params = {}
+        # Filters go in the query string; sorting the keys keeps the URL stable for
+        # equivalent queries so responses can be cached by URL
         if query:
-            params['query'] = json.dumps(query)
+            params['query'] = _dumps_sorted(query)
         if sort:
-            params['sort'] = json.dumps(sort)
+            # Key order of sort is significant and must be preserved
+            params['sort'] = _dumps(sort).decode()
         if limit:
             params['limit'] = limit
-            
-        return await self._request('GET', f'/api/{collection_name}', params=params)
+        return params
     
     async def create_document(self, collection_name: str, document: Dict) -> Dict:
         """
@@ -518,7 +967,9 @@ class AsyncMaseDBClient:
                 "message": "Document created successfully"
             }
         """
-        return await self._request('POST', f'/api/{collection_name}', json=document)
+        result = await self._request('POST', self._url('api', collection_name), json=document)
+        self._invalidate('collections', f'collection:{collection_name}', 'stats')
+        return result
     
     async def get_document(self, collection_name: str, document_id: str) -> Dict:
         """
@@ -540,7 +991,30 @@ class AsyncMaseDBClient:
                 }
             }
         """
-        return await self._request('GET', f'/api/{collection_name}/{document_id}')
+        return await self._request('GET', self._url('api', collection_name, document_id))
+
+    async def get_documents_by_ids(self, collection_name: str, document_ids: List[str]) -> List[Dict]:
+        """
+        Get several documents by ID concurrently.
+        
+        Args:
+            collection_name (str): Name of the collection
+            document_ids (List[str]): IDs of the documents
+            
+        Returns:
+            List[Dict]: Document contents, in the same order as ``document_ids``
+            
+        Example:
+            >>> await client.get_documents_by_ids("users", ["doc123", "doc456"])
+            [
+                {"document": {"name": "John"}},
+                {"document": {"name": "Jane"}}
+            ]
+        """
+        return await self._gather_limited(
+            (self.get_document(collection_name, document_id) for document_id in document_ids),
+            min(len(document_ids), self._pool_size)
+        )
     
     async def update_document(self, collection_name: str, document_id: str, update: Dict) -> Dict:
         """
@@ -578,7 +1052,40 @@ class AsyncMaseDBClient:
                 "message": "Document updated successfully"
             }
         """
-        return await self._request('PUT', f'/api/{collection_name}/{document_id}', json=update)
+        result = await self._request('PUT', self._url('api', collection_name, document_id), json=update)
+        self._invalidate('collections', f'collection:{collection_name}', 'stats')
+        return result
+
+    async def bulk_update(self, collection_name: str, updates: List[Tuple[str, Dict]], chunk_size: int = 500) -> List[Dict]:
+        """
+        Update multiple documents.
+        
+        Updates are sent to the bulk endpoint in chunks of ``chunk_size``, with
+        chunks uploaded concurrently. If the server has no bulk endpoint, each
+        document is updated with its own request, still concurrently.
+        
+        Args:
+            collection_name (str): Name of the collection
+            updates (List[Tuple[str, Dict]]): Pairs of document ID and update
+                operations (see update_document for supported operators)
+            chunk_size (int, optional): Maximum number of updates per request
+            
+        Returns:
+            List[Dict]: Server responses, one per chunk (or one per document
+                if the bulk endpoint is unavailable)
+            
+        Example:
+            >>> await client.bulk_update("users", [
+            ...     ("doc123", {"$set": {"status": "active"}}),
+            ...     ("doc456", {"$inc": {"visits": 1}})
+            ... ])
+            [{"message": "Documents updated successfully", "count": 2}]
+        """
+        items = [{"_id": document_id, "update": update} for document_id, update in updates]
+        return await self._bulk_request(
+            'PUT', collection_name, 'updates', items, chunk_size,
+            lambda item: self.update_document(collection_name, item["_id"], item["update"])
+        )
     
     async def delete_document(self, collection_name: str, document_id: str) -> Dict:
         """
@@ -597,7 +1104,35 @@ class AsyncMaseDBClient:
                 "message": "Document deleted successfully"
             }
         """
-        return await self._request('DELETE', f'/api/{collection_name}/{document_id}')
+        result = await self._request('DELETE', self._url('api', collection_name, document_id))
+        self._invalidate('collections', f'collection:{collection_name}', 'stats')
+        return result
+
+    async def bulk_delete(self, collection_name: str, document_ids: List[str], chunk_size: int = 500) -> List[Dict]:
+        """
+        Delete multiple documents.
+        
+        IDs are sent to the bulk endpoint in chunks of ``chunk_size``, with
+        chunks sent concurrently. If the server has no bulk endpoint, each
+        document is deleted with its own request, still concurrently.
+        
+        Args:
+            collection_name (str): Name of the collection
+            document_ids (List[str]): IDs of the documents
+            chunk_size (int, optional): Maximum number of IDs per request
+            
+        Returns:
+            List[Dict]: Server responses, one per chunk (or one per document
+                if the bulk endpoint is unavailable)
+            
+        Example:
+            >>> await client.bulk_delete("users", ["doc123", "doc456"])
+            [{"message": "Documents deleted successfully", "count": 2}]
+        """
+        return await self._bulk_request(
+            'DELETE', collection_name, 'ids', document_ids, chunk_size,
+            lambda document_id: self.delete_document(collection_name, document_id)
+        )
     
     # Indexes API
     async def create_index(self, collection_name: str, fields: List[str]) -> Dict:
@@ -621,9 +1156,11 @@ class AsyncMaseDBClient:
                 }
             }
         """
-        return await self._request('POST', f'/api/collection/{collection_name}/index', json={
+        result = await self._request('POST', self._url('api', 'collection', collection_name, 'index'), json={
             "fields": fields
         })
+        self._invalidate('collections', f'collection:{collection_name}', f'indexes:{collection_name}', 'stats')
+        return result
     
     async def list_indexes(self, collection_name: str) -> Dict:
         """
@@ -646,7 +1183,8 @@ class AsyncMaseDBClient:
                 ]
             }
         """
-        return await self._request('GET', f'/api/collection/{collection_name}/index')
+        return await self._cached(f'indexes:{collection_name}', self._meta_ttl,
+                                  lambda: self._request('GET', self._url('api', 'collection', collection_name, 'index')))
     
     # Transactions API
     async def start_transaction(self) -> TransactionInfo:
@@ -663,7 +1201,7 @@ class AsyncMaseDBClient:
                 "status": "active"
             }
         """
-        return await self._request('POST', '/api/transaction')
+        return await self._request('POST', self._transaction_url, data=_EMPTY_JSON_BYTES)
     
     async def commit_transaction(self, transaction_id: str) -> Dict:
         """
@@ -681,7 +1219,10 @@ class AsyncMaseDBClient:
                 "status": "committed"
             }
         """
-        return await self._request('POST', f'/api/transaction/{transaction_id}')
+        result = await self._request('POST', self._url('api', 'transaction', transaction_id), data=_EMPTY_JSON_BYTES)
+        # Committed changes may touch any collection
+        self.clear_cache()
+        return result
     
     async def rollback_transaction(self, transaction_id: str) -> Dict:
         """
@@ -699,7 +1240,7 @@ class AsyncMaseDBClient:
                 "status": "rolled_back"
             }
         """
-        return await self._request('POST', f'/api/transaction/{transaction_id}/rollback')
+        return await self._request('POST', self._url('api', 'transaction', transaction_id, 'rollback'), data=_EMPTY_JSON_BYTES)
     
     async def get_transaction_status(self, transaction_id: str) -> TransactionInfo:
         """
@@ -720,7 +1261,56 @@ class AsyncMaseDBClient:
                 "changes_count": 5
             }
         """
-        return await self._request('GET', f'/api/transaction/{transaction_id}')
+        return await self._request('GET', self._url('api', 'transaction', transaction_id))
+
+    async def run_transaction(self, operations: List[Callable[[str], Awaitable]]) -> List[Any]:
+        """
+        Run operations concurrently inside a transaction.
+        
+        Starts a transaction, runs all operations concurrently and commits once
+        every one of them has succeeded. If any operation fails, the transaction
+        is rolled back and the first error is raised. Operations run in no
+        particular order, so they must not depend on each other.
+        
+        Args:
+            operations (List[Callable[[str], Awaitable]]): Callables that take the
+                transaction ID and return an awaitable
+            
+        Returns:
+            List[Any]: Results of the operations, in the same order as ``operations``
+            
+        Example:
+            >>> await client.run_transaction([
+            ...     lambda tx: client.update_document("accounts", "ACC001", {"$inc": {"balance": -100}}),
+            ...     lambda tx: client.update_document("accounts", "ACC002", {"$inc": {"balance": 100}}),
+            ...     lambda tx: client.create_document("transactions", {"transaction_id": tx, "amount": 100})
+            ... ])
+            [
+                {"message": "Document updated successfully"},
+                {"message": "Document updated successfully"},
+                {"document": {...}, "message": "Document created successfully"}
+            ]
+        """
+        transaction = await self.start_transaction()
+        transaction_id = transaction["transaction_id"]
+        try:
+            # Let every operation finish before deciding, so none is still running during rollback
+            results = await self._gather_limited(
+                (operation(transaction_id) for operation in operations), return_exceptions=True
+            )
+            errors = [result for result in results if isinstance(result, BaseException)]
+            if errors:
+                raise errors[0]
+            await self.commit_transaction(transaction_id)
+        except BaseException as e:
+            # Also covers cancellation and a failed commit; the original error is what gets raised
+            logger.error(f"Transaction {transaction_id} failed, rolling back: {e!r}")
+            try:
+                await self.rollback_transaction(transaction_id)
+            except Exception as rollback_error:
+                logger.error(f"Rollback of transaction {transaction_id} failed: {rollback_error}")
+            raise
+        return results
 
     # Statistics API
     async def get_stats(self) -> DatabaseStats:
@@ -761,7 +1351,7 @@ class AsyncMaseDBClient:
                 }
             }
         """
-        return await self._request('GET', '/api/stats')
+        return await self._cached('stats', self._meta_ttl, lambda: self._request('GET', self._stats_url))
     
     async def get_detailed_stats(self) -> DetailedStats:
         """
@@ -793,4 +1383,20 @@ class AsyncMaseDBClient:
                 }
             }
         """
-        return await self._request('GET', '/api/stats/detailed') 
\ No newline at end of file
+        return await self._request('GET', self._detailed_stats_url)
+
+
+def _close_shared_sessions() -> None:
+    """Close shared sessions still open at interpreter exit (best effort)"""
+    sessions = AsyncMaseDBClient._shared_sessions
+    for (_, _, loop), session in list(sessions.items()):
+        # A session can only be closed on its own loop, and only while that loop is idle
+        if session.closed or loop.is_closed() or loop.is_running():
+            continue
+        try:
+            loop.run_until_complete(session.close())
+        except Exception as e:
+            logger.debug("Error closing shared session at exit: %s", e)
+    sessions.clear()
+
+atexit.register(_close_shared_sessions)
\ No newline at end of file
@@ -66,18 +66,113 @@ Statistics API:
 - GET /api/stats/detailed - Get detailed database statistics (admin only)
 """
 import requests
+import email.utils
 import logging
 import json
-from typing import Dict, List, Optional, Union, Any, TypedDict
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Union, Any, Tuple, Callable, Iterator, TypedDict
 from datetime import datetime
+from urllib3.exceptions import ConnectTimeoutError
 from masedb.exceptions import MaseDBError, ERROR_MAP
 
-# Настройка логирования
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Настройка логирования: уровень и обработчики задает приложение
 logger = logging.getLogger('MaseDBClient')
+logger.addHandler(logging.NullHandler())
+
+# orjson is optional; fall back to the standard library when it is not installed
+try:
+    import orjson
+    _loads = orjson.loads
+    
+    # numpy arrays are serialized natively, naive datetimes are treated as UTC and
+    # non-str dict keys are converted to strings as the standard library does
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+    
+    # Integers wider than 64 bits are rejected by orjson but supported by the standard library
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            return json.dumps(obj, separators=(',', ':')).encode()
+    
+    def _dumps_sorted(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS).decode()
+        except TypeError:
+            return json.dumps(obj, separators=(',', ':'), sort_keys=True)
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+    
+    def _dumps_sorted(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'), sort_keys=True)
+
+# Methods whose requests always carry a JSON body
+_WRITE_METHODS = frozenset({'POST', 'PUT'})
+
+# Per-request headers for JSON bodies, shared by all calls and never mutated
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Pre-encoded body for POST endpoints that take no parameters
+_EMPTY_JSON_BYTES = b'{}'
+
+# Statuses meaning the server has no bulk endpoint for a collection
+_BULK_UNSUPPORTED_STATUSES = frozenset({404, 405})
+
+# Size of network reads fed to the streaming JSON parser
+_STREAM_CHUNK_SIZE = 65536
+
+# Maximum number of entries in the metadata cache before the oldest is evicted
+_META_CACHE_SIZE = 1024
+
+# Retries use exponential backoff with full jitter so that clients do not retry in lockstep.
+# 429 and failures to establish a connection are retried for any method since the server
+# did not process the request, server errors and read failures only for methods that are safe to repeat.
+_MAX_ATTEMPTS = 3
+_RETRY_BACKOFF_BASE = 0.5
+_RETRY_MAX_DELAY = 10.0
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({'GET', 'PUT', 'DELETE'})
+
+# The circuit breaker opens after consecutive failed calls and fails fast for the cooldown,
+# after which a single probe call decides whether it closes again
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 30.0
+
+# Request failures that say something about the server or network; client-side errors
+# such as an invalid URL or header do not count towards opening the breaker
+_BREAKER_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError
+)
+
+def _is_connect_error(error: requests.exceptions.RequestException) -> bool:
+    """Whether the request failed before a connection to the server was established"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    # requests wraps urllib3's MaxRetryError, whose reason is the underlying failure;
+    # NewConnectionError (refused, unreachable, DNS) is a ConnectTimeoutError subclass
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(error, requests.exceptions.ConnectionError) and isinstance(reason, ConnectTimeoutError)
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header (delay in seconds or HTTP date) to seconds to wait"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
 
 class CollectionInfo(TypedDict):
     """Type definition for collection information"""
@@ -134,27 +229,65 @@ class MaseDBClient:
     API Key Authentication:
     Include the API key in the X-API-Key header:
     X-API-Key: <your_api_key>
+    
+    Connection Pooling:
+    Requests are sent over HTTP/1.1 keep-alive connections. Each host keeps up
+    to ``pool_size`` idle connections for reuse, so up to that many threads can
+    share one client without opening new connections. When more threads are
+    active, extra connections are opened and closed after use instead of
+    blocking.
     """
     
-    def __init__(self, api_key: str, base_url: str = "https://masedb.maseai.online"):
+    # Clients are created per worker, so skip the per-instance __dict__
+    __slots__ = (
+        'api_key', 'BASE_URL', 'session',
+        '_collections_url', '_collections_list_url', '_transaction_url', '_stats_url', '_detailed_stats_url',
+        '_collection_url', '_documents_url', '_document_url', '_bulk_url', '_index_url',
+        '_transaction_id_url', '_rollback_url',
+        '_breaker_lock', '_breaker_failures', '_breaker_opened_at',
+        '_meta_ttl', '_meta_cache', '_meta_lock', '_meta_generation'
+    )
+    
+    def __init__(self, api_key: str, base_url: str = "https://masedb.maseai.online", pool_size: int = 100,
+                 cache_ttl: float = 5.0):
         """
         Initialize MaseDB client.
         
         Args:
             api_key (str): API key for authentication
             base_url (str): Base URL of the API server
+            pool_size (int): Maximum number of pooled keep-alive connections per host
+            cache_ttl (float): Seconds to cache collection and index metadata before
+                revalidating it with the server's ETag
         """
         self.api_key = api_key
         self.BASE_URL = base_url.rstrip('/')
         
-        # Configure session with retries and timeouts
+        # Prebuilt URLs: fixed endpoints are complete strings, templated ones are bound %-formatters
+        base = self.BASE_URL
+        self._collections_url = base + '/api/collections'
+        self._collections_list_url = base + '/api/collections/list'
+        self._transaction_url = base + '/api/transaction'
+        self._stats_url = base + '/api/stats'
+        self._detailed_stats_url = base + '/api/stats/detailed'
+        # Percent-encoded characters in the base URL must not be taken for format specifiers
+        template = base.replace('%', '%%')
+        self._collection_url = (template + '/api/collections/%s').__mod__
+        self._documents_url = (template + '/api/%s').__mod__
+        self._document_url = (template + '/api/%s/%s').__mod__
+        self._bulk_url = (template + '/api/%s/bulk').__mod__
+        self._index_url = (template + '/api/collection/%s/index').__mod__
+        self._transaction_id_url = (template + '/api/transaction/%s').__mod__
+        self._rollback_url = (template + '/api/transaction/%s/rollback').__mod__
+        
+        # Configure session and timeouts; retries are handled by _request
         self.session = requests.Session()
-        retry_strategy = requests.adapters.Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=[500, 502, 503, 504]
+        adapter = requests.adapters.HTTPAdapter(
+            max_retries=0,
+            pool_connections=20,
+            pool_maxsize=pool_size,
+            pool_block=False
         )
-        adapter = requests.adapters.HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -173,80 +306,196 @@ class MaseDBClient:
             'Accept': 'application/json',
             'X-API-Key': self.api_key
         })
+        
+        # Circuit breaker state, shared by all threads using this client
+        self._breaker_lock = threading.Lock()
+        self._breaker_failures = 0
+        self._breaker_opened_at: Optional[float] = None
+        
+        # Metadata cache: GET URL -> (expires_at, etag, value)
+        self._meta_ttl = cache_ttl
+        self._meta_cache: Dict[str, Tuple[float, Optional[str], Any]] = {}
+        self._meta_lock = threading.RLock()
+        self._meta_generation = 0
             
-        logger.info(f"Initialized MaseDB client with base URL: {self.BASE_URL}")
+        logger.debug("Initialized MaseDB client with base URL: %s", self.BASE_URL)
     
     def _handle_response(self, response: requests.Response) -> Any:
         """Handle API response and raise appropriate exceptions"""
+        status = response.status_code
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
         # Log response details
-        logger.debug(f"Response status code: {response.status_code}")
-        logger.debug(f"Response headers: {response.headers}")
+        if debug:
+            logger.debug("Response status code: %s", status)
+            logger.debug("Response headers: %s", response.headers)
         
-        # Get response body
+        # Get response body; it is only decoded to text for logging and errors
         try:
-            body = response.text
-            logger.debug(f"Response body: {body}")
+            raw = response.content or b''
         except Exception as e:
             logger.error(f"Error reading response body: {str(e)}")
-            body = None
+            raw = b''
+        if debug:
+            logger.debug("Response body: %s", raw.decode('utf-8', 'replace'))
             
-        # Check content type
-        content_type = response.headers.get('Content-Type', '')
-        if response.ok:
-            if not body:
+        if status < 400:
+            if not raw:
                 return None
-            if 'application/json' not in content_type:
-                logger.error(f"Expected JSON response, got {content_type}")
-                raise MaseDBError(f"Invalid response format: Expected JSON, got {content_type}")
+            # Content type is only checked to explain a body that fails to parse
             try:
-                return response.json()
+                return _loads(raw)
             except ValueError as e:
+                content_type = response.headers.get('Content-Type', '')
+                if 'application/json' not in content_type:
+                    logger.error(f"Expected JSON response, got {content_type}")
+                    raise MaseDBError(f"Invalid response format: Expected JSON, got {content_type}")
                 logger.error(f"Error decoding JSON response: {str(e)}")
                 raise MaseDBError(f"Invalid JSON response: {str(e)}")
         else:
             # Try to get error details from response
-            error_message = f"HTTP {response.status_code}: {body or 'No response body'}"
+            content_type = response.headers.get('Content-Type', '')
+            retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+            body = response.text if raw else ''
+            error_message = f"HTTP {status}: {body or 'No response body'}"
             if 'application/json' in content_type:
                 try:
-                    error_data = response.json()
+                    error_data = _loads(raw)
                     if 'error' in error_data:
                         error_message = error_data['error'].get('message', error_message)
                         error_code = error_data['error'].get('code', 'UNKNOWN_ERROR')
                         error_details = error_data['error'].get('details', {})
-                        raise MaseDBError(error_message, error_code, error_details)
+                        raise MaseDBError(error_message, error_code, error_details, status, retry_after)
                 except ValueError:
                     pass
             logger.error(f"API error: {error_message}")
-            raise MaseDBError(error_message)
+            raise MaseDBError(error_message, status_code=status, retry_after=retry_after)
     
-    def _request(self, method: str, endpoint: str, **kwargs) -> Any:
-        """Make HTTP request to API"""
-        url = f"{self.BASE_URL}{endpoint}"
-        
-        # Add API key to headers
-        headers = kwargs.pop('headers', {})
-        headers['X-API-Key'] = self.api_key
-        headers['Accept'] = 'application/json'
-        
-        # Only set Content-Type for POST/PUT requests
-        if method in ['POST', 'PUT']:
-            headers['Content-Type'] = 'application/json'
-        else:
-            # Remove Content-Type for GET/DELETE requests
-            headers.pop('Content-Type', None)
+    def _request(self, method: str, url: str, **kwargs) -> Any:
+        """Make HTTP request to API and return the decoded response body"""
+        return self._send(method, url, **kwargs)[1]
+    
+    def _send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+              **kwargs) -> Tuple[requests.Response, Any]:
+        """Send HTTP request to API, retrying transient failures with jittered exponential backoff"""
+        # X-API-Key and Accept are session defaults, only Content-Type varies per request
+        if headers is None and (method in _WRITE_METHODS or 'json' in kwargs):
+            headers = _JSON_HEADERS
         
         # Log request details
-        logger.debug(f"Making {method} request to {url}")
-        logger.debug(f"Request headers: {headers}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Making %s request to %s", method, url)
+            logger.debug("Request headers: %s", headers)
+            if 'json' in kwargs:
+                logger.debug("Request body: %s", kwargs['json'])
         if 'json' in kwargs:
-            logger.debug(f"Request body: {kwargs['json']}")
+            # Serialize with orjson (when available) instead of requests' stdlib encoder
+            kwargs['data'] = _dumps(kwargs.pop('json'))
             
-        try:
-            response = self.session.request(method, url, headers=headers, **kwargs)
-            return self._handle_response(response)
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {str(e)}")
-            raise MaseDBError(f"Request failed: {str(e)}")
+        # The breaker is checked and updated once per call, never between retries of a call
+        self._check_breaker()
+        idempotent = method in _IDEMPOTENT_METHODS
+        for attempt in range(_MAX_ATTEMPTS):
+            last = attempt == _MAX_ATTEMPTS - 1
+            try:
+                response = self.session.request(method, url, headers=headers, **kwargs)
+                result = self._handle_response(response)
+            except requests.exceptions.RequestException as e:
+                if last or not (idempotent or _is_connect_error(e)):
+                    self._record_call(failed=isinstance(e, _BREAKER_ERRORS))
+                    logger.error(f"Request failed: {str(e)}")
+                    raise MaseDBError(f"Request failed: {str(e)}")
+                error, retry_after = e, None
+            except MaseDBError as e:
+                if last or not (e.status_code == 429 or idempotent and e.status_code in _RETRY_STATUSES):
+                    self._record_call(failed=e.status_code in _RETRY_STATUSES)
+                    raise
+                error, retry_after = e, e.retry_after
+            else:
+                self._record_call(failed=False)
+                return response, result
+            if retry_after is not None:
+                delay = min(retry_after, _RETRY_MAX_DELAY)
+            else:
+                delay = random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BACKOFF_BASE * 2 ** attempt))
+            logger.warning(f"{method} {url} failed ({error}), retrying in {delay:.2f}s")
+            time.sleep(delay)
+
+    def _check_breaker(self) -> None:
+        """Fail fast while the circuit breaker is open, letting one probe call through per cooldown"""
+        with self._breaker_lock:
+            opened_at = self._breaker_opened_at
+            if opened_at is None:
+                return
+            now = time.monotonic()
+            if now - opened_at < _BREAKER_COOLDOWN:
+                raise MaseDBError("Circuit breaker is open after repeated failures, retry later", 'CIRCUIT_OPEN')
+            # Half-open: this call is the probe, other callers keep failing fast until it completes
+            self._breaker_opened_at = now
+
+    def _record_call(self, failed: bool) -> None:
+        """Record the outcome of a call and open the circuit breaker after consecutive failures"""
+        with self._breaker_lock:
+            if not failed:
+                self._breaker_failures = 0
+                self._breaker_opened_at = None
+                return
+            self._breaker_failures += 1
+            if self._breaker_failures >= _BREAKER_THRESHOLD:
+                if self._breaker_opened_at is None:
+                    logger.error(f"Circuit breaker opened for {_BREAKER_COOLDOWN}s after "
+                                 f"{self._breaker_failures} consecutive failed calls")
+                self._breaker_opened_at = time.monotonic()
+
+    def _cached(self, url: str) -> Any:
+        """Return the cached GET result for ``url`` while fresh, otherwise revalidate it with its ETag"""
+        with self._meta_lock:
+            entry = self._meta_cache.get(url)
+            generation = self._meta_generation
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[2]
+        
+        etag = entry[1] if entry is not None else None
+        response, value = self._send('GET', url, headers={'If-None-Match': etag} if etag else None)
+        if response.status_code == 304:
+            value = entry[2]
+        with self._meta_lock:
+            # Do not store a result that may predate an invalidation made while it was in flight
+            if generation == self._meta_generation:
+                if url not in self._meta_cache and len(self._meta_cache) >= _META_CACHE_SIZE:
+                    del self._meta_cache[next(iter(self._meta_cache))]
+                self._meta_cache[url] = (time.monotonic() + self._meta_ttl, response.headers.get('ETag', etag), value)
+        return value
+
+    def _invalidate(self, *urls: str) -> None:
+        """Drop cached metadata entries affected by a write"""
+        with self._meta_lock:
+            self._meta_generation += 1
+            for url in urls:
+                self._meta_cache.pop(url, None)
+
+    def clear_cache(self) -> None:
+        """Drop all cached collection and index metadata"""
+        with self._meta_lock:
+            self._meta_generation += 1
+            self._meta_cache.clear()
+
+    def _bulk_request(self, method: str, collection_name: str, field: str, items: List[Any],
+                      chunk_size: int, fallback: Callable[[Any], Dict]) -> List[Dict]:
+        """Send items to the collection's bulk endpoint in chunks, or one by one if it is unavailable"""
+        url = self._bulk_url(collection_name)
+        results = []
+        for start in range(0, len(items), chunk_size):
+            try:
+                results.append(self._request(method, url, json={field: items[start:start + chunk_size]}))
+                self._invalidate(self._collections_url, self._collection_url(collection_name))
+            except MaseDBError as e:
+                # Only the first chunk can reveal that the bulk endpoint is missing
+                if start or e.status_code not in _BULK_UNSUPPORTED_STATUSES:
+                    raise
+                logger.debug("Bulk endpoint unavailable (HTTP %s), sending items one by one", e.status_code)
+                return [fallback(item) for item in items]
+        return results
 
     def find_one(self, collection_name: str, query: Optional[Dict] = None) -> Optional[DocumentInfo]:
         """
@@ -280,13 +529,20 @@ class MaseDBClient:
                 "age": 30
             }
         """
-        results = self.list_documents(collection_name, query)
+        # Only the first match is needed, so let the server stop after one document
+        results = self.list_documents(collection_name, query, limit=1)
+        # Documents come either as a bare list or as {"documents": [...]}
+        if isinstance(results, dict):
+            results = results.get('documents')
         return results[0] if results else None
 
     def insert_one(self, collection_name: str, document: Dict) -> Dict:
         """
         Insert a single document into the collection.
         
+        To insert several documents, use insert_many, which sends them in
+        batches instead of one request per document.
+        
         Args:
             collection_name (str): Name of the collection
             document (Dict): Document to insert
@@ -302,6 +558,66 @@ class MaseDBClient:
             {"id": "doc123"}
         """
         return self.create_document(collection_name, document)
+
+    def insert_many(self, collection_name: str, documents: List[Dict], chunk_size: int = 500) -> List[Dict]:
+        """
+        Insert multiple documents into the collection.
+        
+        Documents are sent to the bulk endpoint in chunks of ``chunk_size``. If
+        the server has no bulk endpoint, each document is created with its own
+        request.
+        
+        Args:
+            collection_name (str): Name of the collection
+            documents (List[Dict]): Documents to insert
+            chunk_size (int, optional): Maximum number of documents per request
+            
+        Returns:
+            List[Dict]: Server responses, one per chunk (or one per document
+                if the bulk endpoint is unavailable)
+            
+        Example:
+            >>> client.insert_many("users", [
+            ...     {"name": "John", "age": 30},
+            ...     {"name": "Jane", "age": 25}
+            ... ])
+            [{"message": "Documents created successfully", "count": 2}]
+        """
+        return self._bulk_request(
+            'POST', collection_name, 'documents', documents, chunk_size,
+            lambda document: self.create_document(collection_name, document)
+        )
+
+    def find_many(self, collection_name: str, document_ids: List[str], chunk_size: int = 500) -> List[DocumentInfo]:
+        """
+        Find documents by their IDs.
+        
+        Uses one ``$in`` query per ``chunk_size`` IDs instead of one request per
+        document. IDs that do not match a document are skipped, and documents
+        are returned in the order the server lists them.
+        
+        Args:
+            collection_name (str): Name of the collection
+            document_ids (List[str]): IDs of the documents
+            chunk_size (int, optional): Maximum number of IDs per request
+            
+        Returns:
+            List[DocumentInfo]: Documents with matching IDs
+            
+        Example:
+            >>> client.find_many("users", ["doc123", "doc456"])
+            [
+                {"_id": "doc123", "name": "John"},
+                {"_id": "doc456", "name": "Jane"}
+            ]
+        """
+        documents = []
+        for start in range(0, len(document_ids), chunk_size):
+            chunk = document_ids[start:start + chunk_size]
+            result = self.list_documents(collection_name, {"_id": {"$in": chunk}})
+            # Documents come either as a bare list or as {"documents": [...]}
+            documents.extend(result.get('documents', []) if isinstance(result, dict) else result)
+        return documents
     
     # Collections API
     def list_collections(self) -> List[CollectionInfo]:
@@ -324,7 +640,7 @@ class MaseDBClient:
                 }
             ]
         """
-        return self._request('GET', '/api/collections')
+        return self._cached(self._collections_url)
 
     def list_collections_detailed(self) -> Dict:
         """
@@ -351,7 +667,7 @@ class MaseDBClient:
                 "total": 1
             }
         """
-        return self._request('GET', '/api/collections/list')
+        return self._request('GET', self._collections_list_url)
 
     def create_collection(self, name: str, description: str = "") -> Dict:
         """
@@ -376,10 +692,12 @@ class MaseDBClient:
                 }
             }
         """
-        return self._request('POST', '/api/collections', json={
+        result = self._request('POST', self._collections_url, json={
             "name": name,
             "description": description
         })
+        self._invalidate(self._collections_url, self._collection_url(name))
+        return result
     
     def get_collection(self, name: str) -> Dict:
         """
@@ -403,7 +721,7 @@ class MaseDBClient:
                 "indexes": []
             }
         """
-        return self._request('GET', f'/api/collections/{name}')
+        return self._cached(self._collection_url(name))
     
     def delete_collection(self, name: str) -> Dict:
         """
@@ -422,7 +740,9 @@ class MaseDBClient:
             >>> client.delete_collection("users")
             {"message": "Collection deleted successfully"}
         """
-        return self._request('DELETE', f'/api/collections/{name}')
+        result = self._request('DELETE', self._collection_url(name))
+        self._invalidate(self._collections_url, self._collection_url(name), self._index_url(name))
+        return result
     
     # Documents API
     def list_documents(self, collection_name: str, query: Optional[Dict] = None, sort: Optional[Dict] = None, limit: Optional[int] = None) -> List[DocumentInfo]:
@@ -470,15 +790,89 @@ class MaseDBClient:
                 "count": 1
             }
         """
+        return self._request('GET', self._documents_url(collection_name), params=self._list_params(query, sort, limit))
+
+    def iter_documents(self, collection_name: str, query: Optional[Dict] = None, sort: Optional[Dict] = None, limit: Optional[int] = None) -> Iterator[DocumentInfo]:
+        """
+        Iterate over documents from collection while the response streams in.
+        
+        Unlike list_documents, the response is parsed incrementally and each
+        document is yielded as soon as it has been received, so memory use is
+        bounded by a single document instead of the whole result set. For small
+        results list_documents is faster. Requires the ``ijson`` package.
+        
+        Args:
+            collection_name (str): Name of the collection
+            query (Dict, optional): Query conditions for filtering documents (see list_documents)
+            sort (Dict, optional): Fields for sorting (1 for ascending, -1 for descending)
+            limit (int, optional): Maximum number of documents to return
+            
+        Yields:
+            DocumentInfo: Documents matching the query
+            
+        Example:
+            >>> for document in client.iter_documents("users", {"age": {"$gt": 25}}):
+            ...     print(document["name"])
+        """
+        try:
+            import ijson
+        except ImportError:
+            raise ImportError("iter_documents requires the 'ijson' package: pip install ijson")
+        
+        url = self._documents_url(collection_name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Streaming GET request to %s", url)
+        self._check_breaker()
+        try:
+            response = self.session.get(url, params=self._list_params(query, sort, limit), stream=True)
+        except requests.exceptions.RequestException as e:
+            self._record_call(failed=isinstance(e, _BREAKER_ERRORS))
+            logger.error(f"Request failed: {str(e)}")
+            raise MaseDBError(f"Request failed: {str(e)}")
+        
+        with response:
+            self._record_call(failed=response.status_code in _RETRY_STATUSES)
+            if not response.ok:
+                # Raises the matching MaseDBError
+                self._handle_response(response)
+            events = ijson.sendable_list()
+            parser = None
+            try:
+                for chunk in response.iter_content(_STREAM_CHUNK_SIZE):
+                    if parser is None:
+                        head = chunk.lstrip()
+                        if not head:
+                            continue
+                        # Documents come either as a bare list or as {"documents": [...]}
+                        prefix = 'item' if head[:1] == b'[' else 'documents.item'
+                        parser = ijson.items_coro(events, prefix, use_float=True)
+                    parser.send(chunk)
+                    yield from events
+                    del events[:]
+                if parser is not None:
+                    parser.close()
+                    yield from events
+            except ijson.JSONError as e:
+                logger.error(f"Error decoding JSON response: {str(e)}")
+                raise MaseDBError(f"Invalid JSON response: {str(e)}")
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Request failed: {str(e)}")
+                raise MaseDBError(f"Request failed: {str(e)}")
+
+    @staticmethod
+    def _list_params(query: Optional[Dict], sort: Optional[Dict], limit: Optional[int]) -> Dict:
+        """Build query-string parameters for listing documents"""
         params = {}
+        # Filters go in the query string and an empty filter is not serialized at all;
+        # sorting the keys keeps the URL stable for equivalent queries
         if query:
-            params['query'] = json.dumps(query)
+            params['query'] = _dumps_sorted(query)
         if sort:
-            params['sort'] = json.dumps(sort)
+            # Key order of sort is significant and must be preserved
+            params['sort'] = _dumps(sort).decode()
         if limit:
             params['limit'] = limit
-            
-        return self._request('GET', f'/api/{collection_name}', params=params)
+        return params
     
     def create_document(self, collection_name: str, document: Dict) -> Dict:
         """
@@ -505,7 +899,9 @@ class MaseDBClient:
                 "message": "Document created successfully"
             }
         """
-        return self._request('POST', f'/api/{collection_name}', json=document)
+        result = self._request('POST', self._documents_url(collection_name), json=document)
+        self._invalidate(self._collections_url, self._collection_url(collection_name))
+        return result
     
     def get_document(self, collection_name: str, document_id: str) -> Dict:
         """
@@ -527,7 +923,7 @@ class MaseDBClient:
                 }
             }
         """
-        return self._request('GET', f'/api/{collection_name}/{document_id}')
+        return self._request('GET', self._document_url((collection_name, document_id)))
     
     def update_document(self, collection_name: str, document_id: str, update: Dict) -> Dict:
         """
@@ -565,7 +961,40 @@ class MaseDBClient:
                 "message": "Document updated successfully"
             }
         """
-        return self._request('PUT', f'/api/{collection_name}/{document_id}', json=update)
+        result = self._request('PUT', self._document_url((collection_name, document_id)), json=update)
+        self._invalidate(self._collections_url, self._collection_url(collection_name))
+        return result
+
+    def bulk_update(self, collection_name: str, updates: List[Tuple[str, Dict]], chunk_size: int = 500) -> List[Dict]:
+        """
+        Update multiple documents.
+        
+        Updates are sent to the bulk endpoint in chunks of ``chunk_size``. If
+        the server has no bulk endpoint, each document is updated with its own
+        request.
+        
+        Args:
+            collection_name (str): Name of the collection
+            updates (List[Tuple[str, Dict]]): Pairs of document ID and update
+                operations (see update_document for supported operators)
+            chunk_size (int, optional): Maximum number of updates per request
+            
+        Returns:
+            List[Dict]: Server responses, one per chunk (or one per document
+                if the bulk endpoint is unavailable)
+            
+        Example:
+            >>> client.bulk_update("users", [
+            ...     ("doc123", {"$set": {"status": "active"}}),
+            ...     ("doc456", {"$inc": {"visits": 1}})
+            ... ])
+            [{"message": "Documents updated successfully", "count": 2}]
+        """
+        items = [{"_id": document_id, "update": update} for document_id, update in updates]
+        return self._bulk_request(
+            'PUT', collection_name, 'updates', items, chunk_size,
+            lambda item: self.update_document(collection_name, item["_id"], item["update"])
+        )
     
     def delete_document(self, collection_name: str, document_id: str) -> Dict:
         """
@@ -584,7 +1013,35 @@ class MaseDBClient:
                 "message": "Document deleted successfully"
             }
         """
-        return self._request('DELETE', f'/api/{collection_name}/{document_id}')
+        result = self._request('DELETE', self._document_url((collection_name, document_id)))
+        self._invalidate(self._collections_url, self._collection_url(collection_name))
+        return result
+
+    def bulk_delete(self, collection_name: str, document_ids: List[str], chunk_size: int = 500) -> List[Dict]:
+        """
+        Delete multiple documents.
+        
+        IDs are sent to the bulk endpoint in chunks of ``chunk_size``. If the
+        server has no bulk endpoint, each document is deleted with its own
+        request.
+        
+        Args:
+            collection_name (str): Name of the collection
+            document_ids (List[str]): IDs of the documents
+            chunk_size (int, optional): Maximum number of IDs per request
+            
+        Returns:
+            List[Dict]: Server responses, one per chunk (or one per document
+                if the bulk endpoint is unavailable)
+            
+        Example:
+            >>> client.bulk_delete("users", ["doc123", "doc456"])
+            [{"message": "Documents deleted successfully", "count": 2}]
+        """
+        return self._bulk_request(
+            'DELETE', collection_name, 'ids', document_ids, chunk_size,
+            lambda document_id: self.delete_document(collection_name, document_id)
+        )
     
     # Indexes API
     def create_index(self, collection_name: str, fields: List[str]) -> Dict:
@@ -608,9 +1065,11 @@ class MaseDBClient:
                 }
             }
         """
-        return self._request('POST', f'/api/collection/{collection_name}/index', json={
+        result = self._request('POST', self._index_url(collection_name), json={
             "fields": fields
         })
+        self._invalidate(self._collections_url, self._collection_url(collection_name), self._index_url(collection_name))
+        return result
     
     def list_indexes(self, collection_name: str) -> Dict:
         """
@@ -633,7 +1092,7 @@ class MaseDBClient:
                 ]
             }
         """
-        return self._request('GET', f'/api/collection/{collection_name}/index')
+        return self._cached(self._index_url(collection_name))
     
     # Transactions API
     def start_transaction(self) -> TransactionInfo:
@@ -650,7 +1109,7 @@ class MaseDBClient:
                 "status": "active"
             }
         """
-        return self._request('POST', '/api/transaction')
+        return self._request('POST', self._transaction_url, data=_EMPTY_JSON_BYTES)
     
     def commit_transaction(self, transaction_id: str) -> Dict:
         """
@@ -668,7 +1127,10 @@ class MaseDBClient:
                 "status": "committed"
             }
         """
-        return self._request('POST', f'/api/transaction/{transaction_id}')
+        result = self._request('POST', self._transaction_id_url(transaction_id), data=_EMPTY_JSON_BYTES)
+        # Committed changes may touch any collection
+        self.clear_cache()
+        return result
     
     def rollback_transaction(self, transaction_id: str) -> Dict:
         """
@@ -686,7 +1148,7 @@ class MaseDBClient:
                 "status": "rolled_back"
             }
         """
-        return self._request('POST', f'/api/transaction/{transaction_id}/rollback')
+        return self._request('POST', self._rollback_url(transaction_id), data=_EMPTY_JSON_BYTES)
     
     def get_transaction_status(self, transaction_id: str) -> TransactionInfo:
         """
@@ -707,7 +1169,7 @@ class MaseDBClient:
                 "changes_count": 5
             }
         """
-        return self._request('GET', f'/api/transaction/{transaction_id}')
+        return self._request('GET', self._transaction_id_url(transaction_id))
 
     # Statistics API
     def get_stats(self) -> DatabaseStats:
@@ -748,7 +1210,7 @@ class MaseDBClient:
                 }
             }
         """
-        return self._request('GET', '/api/stats')
+        return self._request('GET', self._stats_url)
     
     def get_detailed_stats(self) -> DetailedStats:
         """
@@ -780,4 +1242,4 @@ class MaseDBClient:
                 }
             }
         """
-        return self._request('GET', '/api/stats/detailed')
\ No newline at end of file
+        return self._request('GET', self._detailed_stats_url)
\ No newline at end of file
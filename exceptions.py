@@ -72,11 +72,15 @@ class MaseDBError(Exception):
         message (str): Human readable error message
         code (str): Error code from API
         details (dict): Additional error details if available
+        status_code (int): HTTP status code of the response, if any
+        retry_after (float): Seconds to wait before retrying, from the Retry-After header, if any
     """
-    def __init__(self, message, code=None, details=None):
+    def __init__(self, message, code=None, details=None, status_code=None, retry_after=None):
         self.message = message
         self.code = code
         self.details = details
+        self.status_code = status_code
+        self.retry_after = retry_after
         super().__init__(self.message)
 
 class BadRequestError(MaseDBError):